@@ -1,30 +1,104 @@
 import pandas as pd
+import numpy as np
 import json
 from urllib.parse import quote
-from datetime import datetime
+from datetime import date, datetime
 import re
+from functools import lru_cache
+from itertools import chain
+import gzip
+import os
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Expresiones precompiladas para limpiar URIs
+_URI_STRIP = re.compile(r'[^\w\s-]')
+_URI_WS = re.compile(r'\s+')
+
+# Propiedades numéricas: (columna, propiedad, tipo XSD)
+NUMERIC_PROPS = [
+    ('metacritic', 'schema:ratingValue', 'decimal'),
+    ('rating', 'schema:bestRating', 'decimal'),
+    ('playtime', 'vgo:averagePlayTime', 'integer'),
+    ('achievements_count', 'rawg:achievementCount', 'integer'),
+    ('ratings_count', 'schema:ratingCount', 'integer'),
+    ('suggestions_count', 'rawg:suggestionCount', 'integer'),
+    ('game_series_count', 'rawg:gameSeriesCount', 'integer'),
+    ('reviews_count', 'schema:reviewCount', 'integer'),
+    ('added_status_yet', 'rawg:addedStatusYet', 'integer'),
+    ('added_status_owned', 'rawg:addedStatusOwned', 'integer'),
+    ('added_status_beaten', 'rawg:addedStatusBeaten', 'integer'),
+    ('added_status_toplay', 'rawg:addedStatusToPlay', 'integer'),
+    ('added_status_dropped', 'rawg:addedStatusDropped', 'integer'),
+    ('added_status_playing', 'rawg:addedStatusPlaying', 'integer')
+]
+
+# Columnas del CSV que se usan para generar el TTL. Todas se leen como texto
+# para evitar la inferencia de tipos y que una celda mal formada no aborte la
+# lectura; las numéricas se convierten después con pd.to_numeric
+USED_COLUMNS = [
+    'id', 'name', 'slug', 'released', 'website', 'tba', 'updated',
+    'platforms', 'developers', 'publishers', 'genres', 'esrb_rating',
+    *(col for col, _, _ in NUMERIC_PROPS)
+]
+
+# Relaciones con otras entidades: (columna, propiedad, prefijo de la URI)
+ENTITY_RELATIONS = [
+    ('platforms', 'schema:gamePlatform', 'platform'),
+    ('developers', 'schema:developer', 'developer'),
+    ('publishers', 'schema:publisher', 'publisher'),
+    ('genres', 'schema:genre', 'genre'),
+    ('esrb_rating', 'schema:contentRating', 'esrb')
+]
+
+# Filas del CSV que se procesan en memoria a la vez
+CHUNK_SIZE = 100_000
+
+# Buffer de escritura grande para que el sistema reciba pocas escrituras grandes
+OUTPUT_BUFFER_SIZE = 8 << 20
+
+
+@lru_cache(maxsize=None)
+def _clean_uri_cached(text):
+    # Reemplaza caracteres problemáticos y espacios
+    cleaned = _URI_STRIP.sub('', text)
+    cleaned = _URI_WS.sub('_', cleaned.strip())
+    return quote(cleaned)
 
 
 def clean_uri_string(text):
     """Limpia una cadena para usar en URIs"""
     if pd.isna(text) or text == "":
         return None
-    # Reemplaza caracteres problemáticos y espacios
-    cleaned = re.sub(r'[^\w\s-]', '', str(text))
-    cleaned = re.sub(r'\s+', '_', cleaned.strip())
-    return quote(cleaned)
+    return _clean_uri_cached(str(text))
+
+
+def _escape_literal(text):
+    # Escapa comillas y caracteres especiales
+    return text.replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
 
 
 def clean_literal_string(text):
     """Limpia una cadena para usar como literal en TTL"""
     if pd.isna(text) or text == "":
         return None
-    # Escapa comillas y caracteres especiales
-    return str(text).replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
+    return _escape_literal(str(text))
+
+
+def _split_names(field_str):
+    """Separa un valor ya recortado en la lista de nombres delimitados por ||"""
+    # El formato del dataset RAWG usa || como separador
+    if '||' in field_str:
+        # Múltiples valores separados por ||
+        return [v for v in (p.strip() for p in field_str.split('||')) if v]
+    # Valor único
+    return [field_str] if field_str else []
 
 
 def parse_delimited_field(field_value, debug=False):
-    """Parsea campos delimitados por || del dataset RAWG"""
+    """Parsea campos delimitados por || del dataset RAWG como lista de nombres"""
     if pd.isna(field_value) or field_value == "" or str(field_value).strip() == "":
         return []
 
@@ -32,18 +106,7 @@ def parse_delimited_field(field_value, debug=False):
         print(f"Valor original: {repr(field_value)}")
 
     try:
-        field_str = str(field_value).strip()
-
-        # El formato del dataset RAWG usa || como separador
-        if '||' in field_str:
-            # Múltiples valores separados por ||
-            values = [v.strip() for v in field_str.split('||') if v.strip()]
-        else:
-            # Valor único
-            values = [field_str] if field_str else []
-
-        # Convierte a formato dict con 'name' para consistencia con el código existente
-        result = [{'name': value} for value in values if value]
+        result = _split_names(str(field_value).strip())
 
         if debug:
             print(f"Valores parseados: {result}")
@@ -56,252 +119,417 @@ def parse_delimited_field(field_value, debug=False):
         return []
 
 
-def format_date(date_str):
-    """Formatea fecha para TTL"""
-    if pd.isna(date_str) or date_str == "":
-        return None
+def split_delimited_column(series):
+    """Separa de una vez una columna delimitada por || en listas de nombres"""
+    # Las combinaciones se repiten mucho (p. ej. "PC||PlayStation 4"), así que
+    # solo se separa cada valor distinto y las filas comparten la lista
+    codes, uniques = pd.factorize(series.fillna('').astype(str).str.strip())
+    split_values = [_split_names(value) for value in uniques.tolist()]
+    return [split_values[code] for code in codes.tolist()]
+
+
+def _text_list(series, strip=False):
+    """Convierte una columna de texto en lista de str con '' en lugar de NaN"""
+    series = series.fillna('').astype(str)
+    if strip:
+        series = series.str.strip()
+    return series.tolist()
+
+
+def _boolean_list(series):
+    """Convierte una columna booleana en lista de 'true'/'false' ('' si falta)"""
+    is_true = series.fillna('').astype(str).str.lower().isin(['true', '1']).to_numpy()
+    return np.where(series.notna().to_numpy(), np.where(is_true, 'true', 'false'), '').tolist()
+
+
+def _numeric_strings(series, data_type):
+    """
+    Formatea una columna numérica como texto TTL de forma vectorizada
+
+    Las celdas que no son números se tratan como ausentes.
+
+    Returns:
+        Tupla de listas (textos, máscara) donde la máscara marca los valores
+        que se emiten: los enteros presentes, incluido el 0, y los decimales
+        presentes y distintos de 0
+    """
+    arr = pd.to_numeric(series, errors='coerce').to_numpy(dtype='float64')
+    mask = ~np.isnan(arr)
+    if data_type == 'integer':
+        strs = np.where(mask, arr, 0.0).astype(np.int64).astype(str)
+    else:
+        mask &= arr != 0.0
+        strs = arr.astype(str)
+    return strs.tolist(), mask.tolist()
+
+
+# Las fechas distintas son pocas (días) comparadas con los juegos
+@lru_cache(maxsize=None)
+def _format_date_cached(date_str):
     try:
+        # Camino rápido: YYYY-MM-DD ya bien formado, sin pasar por strptime
+        if (len(date_str) == 10 and date_str.isascii() and date_str[4] == '-' and date_str[7] == '-'
+                and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit()):
+            date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+            return date_str
         # Asume formato YYYY-MM-DD
-        datetime.strptime(str(date_str), '%Y-%m-%d')
-        return str(date_str)
+        datetime.strptime(date_str, '%Y-%m-%d')
+        return date_str
     except ValueError:
         return None
 
 
-def generate_ttl_from_rawg_dataset(csv_file_path, output_file_path, limit=None):
+def format_date(date_str):
+    """Formatea fecha para TTL"""
+    # Camino rápido para los str de las columnas ya extraídas ('' si falta)
+    if isinstance(date_str, str):
+        return _format_date_cached(date_str) if date_str else None
+    if pd.isna(date_str):
+        return None
+    return _format_date_cached(str(date_str))
+
+
+def _update_uri_map(uri_map, ref_map, names, prop, prefix):
     """
-    Genera un archivo TTL a partir del dataset RAWG
+    Agrega los nombres que aún no estén en los mapas de entidades
 
     Args:
-        csv_file_path: Ruta al archivo CSV
-        output_file_path: Ruta donde guardar el archivo TTL
-        limit: Número máximo de juegos a procesar (None para todos)
+        uri_map: Dict nombre -> URI limpia
+        ref_map: Dict nombre -> triple de relación ya formateado ('' si la URI queda vacía)
+        names: Nombres encontrados en el bloque actual
+        prop: Propiedad que relaciona el juego con la entidad
+        prefix: Prefijo de la URI de la entidad
     """
+    for name in names:
+        if not name or name in uri_map:
+            continue
+        uri = _clean_uri_cached(name)
+        uri_map[name] = uri
+        ref_map[name] = f' ;\n    {prop} :{prefix}_{uri}' if uri else ''
 
-    # Lee el CSV
-    df = pd.read_csv(csv_file_path)
-
-    if limit:
-        df = df.head(limit)
 
-    # Comienza el archivo TTL
-    ttl_content = """@prefix : <http://www.semanticweb.org/kevin/ontologies/2025/7/VideoGames#> .
-@prefix dcterms: <http://purl.org/dc/terms/> .
-@prefix owl: <http://www.w3.org/2002/07/owl#> .
-@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
-@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-@prefix schema: <http://schema.org/> .
-@prefix rawg: <http://rawg.io/ontology#> .
-@prefix vgo: <http://purl.org/net/VideoGameOntology#> .
+def _extract_columns(chunk):
+    """
+    Extrae de un bloque del CSV las columnas que usa el TTL
 
-"""
+    Cada columna se convierte una sola vez en una lista de objetos nativos de
+    Python: el recorrido de filas no crea escalares de pandas/NumPy.
+    """
+    # Las columnas ausentes en el CSV quedan como NaN
+    data = chunk.reindex(columns=USED_COLUMNS)
+
+    # Rating ESRB - Valor simple, como lista de 0 o 1 elementos
+    esrbs = _text_list(data['esrb_rating'], strip=True)
+
+    return {
+        # El id se conserva como texto, tal como aparece en el CSV
+        'id': data['id'].to_numpy(dtype=object).tolist(),
+        'id_mask': data['id'].notna().tolist(),
+        # Columnas de texto con '' en lugar de NaN: basta con `if valor:`
+        'name': _text_list(data['name']),
+        'slug': _text_list(data['slug']),
+        'released': _text_list(data['released']),
+        'website': _text_list(data['website']),
+        # Booleano ya resuelto como literal TTL
+        'tba': _boolean_list(data['tba']),
+        'updated': _text_list(data['updated']),
+        # Columnas numéricas ya formateadas como texto, con su máscara
+        'numeric': {col: _numeric_strings(data[col], data_type) for col, _, data_type in NUMERIC_PROPS},
+        # Columnas de entidades pre-separadas por ||
+        'platforms': split_delimited_column(data['platforms']),
+        'developers': split_delimited_column(data['developers']),
+        'publishers': split_delimited_column(data['publishers']),
+        'genres': split_delimited_column(data['genres']),
+        'esrb_rating': [[esrb] if esrb else [] for esrb in esrbs],
+    }
+
+
+def _chunk_entity_maps(columns):
+    """
+    Limpia las entidades de un bloque y deja preformateados sus triples de
+    relación
 
-    # Sets para almacenar entidades únicas
-    platforms_set = set()
-    developers_set = set()
-    publishers_set = set()
-    genres_set = set()
-    esrb_ratings_set = set()
+    Returns:
+        Tupla (uri_maps, ref_maps) de dicts columna -> {nombre: URI limpia} y
+        columna -> {nombre: triple de relación}, con las entidades del bloque
+        en el orden en que aparecen
+    """
+    uri_maps = {}
+    ref_maps = {}
+    for col, prop, prefix in ENTITY_RELATIONS:
+        uri_maps[col] = {}
+        ref_maps[col] = {}
+        names = chain.from_iterable(columns[col])
+        _update_uri_map(uri_maps[col], ref_maps[col], names, prop, prefix)
+    return uri_maps, ref_maps
 
-    # Primer pase: recopilar todas las entidades únicas
-    print("Recopilando entidades únicas...")
-    for index, row in df.iterrows():
-        # Plataformas
-        platforms = parse_delimited_field(row.get('platforms', ''))
-        for platform in platforms:
-            if isinstance(platform, dict) and 'name' in platform:
-                platforms_set.add(platform['name'])
 
-        # Desarrolladores
-        developers = parse_delimited_field(row.get('developers', ''))
-        for dev in developers:
-            if isinstance(dev, dict) and 'name' in dev:
-                developers_set.add(dev['name'])
+def _emit_games_chunk(columns, ref_maps):
+    """
+    Genera el TTL de los juegos de un bloque
 
-        # Editores
-        publishers = parse_delimited_field(row.get('publishers', ''))
-        for pub in publishers:
-            if isinstance(pub, dict) and 'name' in pub:
-                publishers_set.add(pub['name'])
+    Args:
+        columns: Columnas del bloque devueltas por _extract_columns
+        ref_maps: Dict columna -> {nombre: triple de relación}
 
-        # Géneros
-        genres = parse_delimited_field(row.get('genres', ''))
-        for genre in genres:
-            if isinstance(genre, dict) and 'name' in genre:
-                genres_set.add(genre['name'])
-
-        # Rating ESRB - Este podría ser un valor simple sin ||
-        esrb = row.get('esrb_rating', '')
-        if not pd.isna(esrb) and esrb != "":
-            esrb_ratings_set.add(str(esrb).strip())
-
-    # Genera las entidades auxiliares
-    print("Generando entidades auxiliares...")
-
-    # Plataformas
-    ttl_content += "# Plataformas\n"
-    for platform in platforms_set:
-        clean_platform = clean_uri_string(platform)
-        if clean_platform:
-            ttl_content += f":platform_{clean_platform} rdf:type schema:VideoGamePlatform ;\n"
-            ttl_content += f'    schema:name "{clean_literal_string(platform)}" .\n\n'
-
-    # Desarrolladores
-    ttl_content += "# Desarrolladores\n"
-    for developer in developers_set:
-        clean_dev = clean_uri_string(developer)
-        if clean_dev:
-            ttl_content += f":developer_{clean_dev} rdf:type schema:Organization ;\n"
-            ttl_content += f'    schema:name "{clean_literal_string(developer)}" .\n\n'
-
-    # Editores
-    ttl_content += "# Editores\n"
-    for publisher in publishers_set:
-        clean_pub = clean_uri_string(publisher)
-        if clean_pub:
-            ttl_content += f":publisher_{clean_pub} rdf:type schema:Organization ;\n"
-            ttl_content += f'    schema:name "{clean_literal_string(publisher)}" .\n\n'
-
-    # Géneros
-    ttl_content += "# Géneros\n"
-    for genre in genres_set:
-        clean_genre = clean_uri_string(genre)
-        if clean_genre:
-            ttl_content += f":genre_{clean_genre} rdf:type schema:Genre ;\n"
-            ttl_content += f'    schema:name "{clean_literal_string(genre)}" .\n\n'
-
-    # Ratings ESRB
-    ttl_content += "# Ratings ESRB\n"
-    for rating in esrb_ratings_set:
-        clean_rating = clean_uri_string(rating)
-        if clean_rating:
-            ttl_content += f":esrb_{clean_rating} rdf:type schema:GameRating ;\n"
-            ttl_content += f'    schema:name "{clean_literal_string(rating)}" .\n\n'
-
-    # Genera los videojuegos
-    print("Generando videojuegos...")
-    ttl_content += "# Videojuegos\n"
-
-    for index, row in df.iterrows():
-        if index % 100 == 0:
-            print(f"Procesando juego {index + 1}/{len(df)}")
-
-        game_id = row.get('id', '')
-        if pd.isna(game_id):
+    Returns:
+        Texto TTL de los juegos del bloque
+    """
+    platform_refs = ref_maps['platforms']
+    developer_refs = ref_maps['developers']
+    publisher_refs = ref_maps['publishers']
+    genre_refs = ref_maps['genres']
+    esrb_refs = ref_maps['esrb_rating']
+
+    # Propiedades numéricas ya formateadas por fila ('' si falta o es 0)
+    numeric_rows = zip(*[
+        [f' ;\n    {prop} "{value}"^^xsd:{data_type}' if present else ''
+         for value, present in zip(*columns['numeric'][col])]
+        for col, prop, data_type in NUMERIC_PROPS
+    ])
+
+    # Cada campo de la fila se lee una sola vez, directamente a una variable local
+    rows = zip(
+        columns['id'], columns['id_mask'], columns['name'], columns['slug'],
+        columns['released'], columns['website'], columns['tba'], columns['updated'],
+        columns['platforms'], columns['developers'], columns['publishers'],
+        columns['genres'], columns['esrb_rating'], numeric_rows
+    )
+
+    # Acumula los triples de todo el bloque y los une una sola vez
+    parts = []
+    for (game_id, has_id, name, slug, release, website, tba, updated,
+         platforms, developers, publishers, genres, esrb_ratings, numeric_row) in rows:
+        if not has_id:
             continue
 
         game_uri = f":game_{game_id}"
-        ttl_content += f"{game_uri} rdf:type schema:VideoGame"
+        parts.append(f"{game_uri} rdf:type schema:VideoGame")
 
         # Propiedades básicas
-        if not pd.isna(row.get('id')):
-            ttl_content += f' ;\n    dcterms:identifier "{row["id"]}"'
+        parts.append(f' ;\n    dcterms:identifier "{game_id}"')
 
-        if not pd.isna(row.get('name')) and row['name'] != "":
-            ttl_content += f' ;\n    schema:name "{clean_literal_string(row["name"])}"'
+        if name:
+            parts.append(f' ;\n    schema:name "{_escape_literal(name)}"')
 
-        if not pd.isna(row.get('slug')) and row['slug'] != "":
-            ttl_content += f' ;\n    schema:alternateName "{clean_literal_string(row["slug"])}"'
+        if slug:
+            parts.append(f' ;\n    schema:alternateName "{_escape_literal(slug)}"')
 
         # Fecha de lanzamiento
-        release_date = format_date(row.get('released'))
+        release_date = format_date(release)
         if release_date:
-            ttl_content += f' ;\n    schema:datePublished "{release_date}"^^xsd:date'
+            parts.append(f' ;\n    schema:datePublished "{release_date}"^^xsd:date')
 
         # URL del sitio web
-        if not pd.isna(row.get('website')) and row['website'] != "":
-            ttl_content += f' ;\n    schema:url "{row["website"]}"^^xsd:anyURI'
+        if website:
+            parts.append(f' ;\n    schema:url "{website}"^^xsd:anyURI')
 
         # Propiedades numéricas
-        numeric_props = [
-            ('metacritic', 'schema:ratingValue', 'decimal'),
-            ('rating', 'schema:bestRating', 'decimal'),
-            ('playtime', 'vgo:averagePlayTime', 'integer'),
-            ('achievements_count', 'rawg:achievementCount', 'integer'),
-            ('ratings_count', 'schema:ratingCount', 'integer'),
-            ('suggestions_count', 'rawg:suggestionCount', 'integer'),
-            ('game_series_count', 'rawg:gameSeriesCount', 'integer'),
-            ('reviews_count', 'schema:reviewCount', 'integer'),
-            ('added_status_yet', 'rawg:addedStatusYet', 'integer'),
-            ('added_status_owned', 'rawg:addedStatusOwned', 'integer'),
-            ('added_status_beaten', 'rawg:addedStatusBeaten', 'integer'),
-            ('added_status_toplay', 'rawg:addedStatusToPlay', 'integer'),
-            ('added_status_dropped', 'rawg:addedStatusDropped', 'integer'),
-            ('added_status_playing', 'rawg:addedStatusPlaying', 'integer')
-        ]
-
-        for col, prop, data_type in numeric_props:
-            value = row.get(col)
-            if not pd.isna(value) and str(value) != "" and str(value) != "0.0":
-                if data_type == 'integer':
-                    ttl_content += f' ;\n    {prop} "{int(float(value))}"^^xsd:integer'
-                else:
-                    ttl_content += f' ;\n    {prop} "{value}"^^xsd:decimal'
+        for fragment in numeric_row:
+            if fragment:
+                parts.append(fragment)
 
         # Propiedades booleanas
-        if not pd.isna(row.get('tba')):
-            tba_value = "true" if str(row['tba']).lower() in ['true', '1'] else "false"
-            ttl_content += f' ;\n    rawg:toBeAnnounced "{tba_value}"^^xsd:boolean'
+        if tba:
+            parts.append(f' ;\n    rawg:toBeAnnounced "{tba}"^^xsd:boolean')
 
         # Fecha de actualización
-        if not pd.isna(row.get('updated')) and row['updated'] != "":
-            ttl_content += f' ;\n    dcterms:modified "{row["updated"]}"^^xsd:dateTime'
+        if updated:
+            parts.append(f' ;\n    dcterms:modified "{updated}"^^xsd:dateTime')
 
         # Relaciones con otras entidades
-
-        # Plataformas
-        platforms = parse_delimited_field(row.get('platforms', ''))
         for platform in platforms:
-            if isinstance(platform, dict) and 'name' in platform:
-                clean_platform = clean_uri_string(platform['name'])
+            parts.append(platform_refs[platform])
+        for dev in developers:
+            parts.append(developer_refs[dev])
+        for pub in publishers:
+            parts.append(publisher_refs[pub])
+        for genre in genres:
+            parts.append(genre_refs[genre])
+
+        # Rating ESRB - Valor simple
+        for rating in esrb_ratings:
+            parts.append(esrb_refs[rating])
+
+        parts.append(" .\n\n")
+
+    return "".join(parts)
+
+
+def _process_games_chunk(chunk):
+    """
+    Genera el TTL de los juegos de un bloque del CSV y recopila sus entidades
+
+    Solo depende de sus argumentos, así que puede ejecutarse entero en otro
+    proceso: la extracción de columnas, la limpieza de URIs y la generación
+    de los juegos se reparten y el proceso principal solo une los resultados.
+
+    Args:
+        chunk: DataFrame con un bloque de filas del CSV
+
+    Returns:
+        Tupla (texto TTL de los juegos, dict columna -> {nombre: URI limpia})
+    """
+    columns = _extract_columns(chunk)
+    uri_maps, ref_maps = _chunk_entity_maps(columns)
+    return _emit_games_chunk(columns, ref_maps), uri_maps
+
+
+def _write_chunk_result(games_buf, uri_maps, result):
+    """Escribe el TTL de un bloque procesado y agrega sus entidades a los mapas"""
+    games_ttl, chunk_uri_maps = result
+    games_buf.write(games_ttl)
+    for col, chunk_uris in chunk_uri_maps.items():
+        # La URI solo depende del nombre y update no mueve las claves que ya
+        # existen: los mapas quedan en orden de primera aparición
+        uri_maps[col].update(chunk_uris)
+
+
+def generate_ttl_from_rawg_dataset(csv_file_path, output_file_path, limit=None, workers=1,
+                                   compress=False):
+    """
+    Genera un archivo TTL a partir del dataset RAWG
+
+    Args:
+        csv_file_path: Ruta al archivo CSV
+        output_file_path: Ruta donde guardar el archivo TTL
+        limit: Número máximo de juegos a procesar (None para todos)
+        workers: Procesos que generan los juegos en paralelo (1 para no
+            usar procesos, None para usar todos los núcleos)
+        compress: Si es True guarda el TTL comprimido con gzip en
+            output_file_path + '.gz'
+    """
+    workers = workers or os.cpu_count() or 1
+    if compress:
+        output_file_path = os.fspath(output_file_path) + '.gz'
+
+    # Mapas nombre -> URI limpia de las entidades únicas
+    platform_uris = {}
+    developer_uris = {}
+    publisher_uris = {}
+    genre_uris = {}
+    esrb_uris = {}
+    uri_maps = {
+        'platforms': platform_uris,
+        'developers': developer_uris,
+        'publishers': publisher_uris,
+        'genres': genre_uris,
+        'esrb_rating': esrb_uris,
+    }
+
+    # Un solo recorrido: los juegos se escriben a un archivo temporal mientras
+    # se recopilan las entidades únicas, que en el TTL van antes que los juegos
+    with tempfile.SpooledTemporaryFile(max_size=64 << 20, mode='w+', encoding='utf-8') as games_buf:
+        print("Generando videojuegos...")
+
+        # Procesos que generan los juegos; las partes pendientes se escriben
+        # en orden y se limitan para acotar la memoria
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        pending = deque()
+        total = 0
+        try:
+            # Lee el CSV (solo las columnas usadas, como texto) por
+            # bloques para que la memoria no crezca con el tamaño del archivo
+            with pd.read_csv(csv_file_path, usecols=lambda c: c in USED_COLUMNS,
+                             dtype=str, engine='c', nrows=limit or None,
+                             chunksize=CHUNK_SIZE) as reader:
+                for chunk in reader:
+                    print(f"Procesando juegos {total + 1}-{total + len(chunk)}")
+                    total += len(chunk)
+
+                    if executor is None:
+                        _write_chunk_result(games_buf, uri_maps, _process_games_chunk(chunk))
+                        continue
+
+                    # Cada bloque leído se reparte en unas `workers` partes
+                    # para que todos trabajen aunque solo haya un bloque
+                    # (p. ej. con limit menor que CHUNK_SIZE). Como mucho hay
+                    # `workers` partes en vuelo: la memoria pendiente no pasa
+                    # de un bloque leído
+                    step = -(-len(chunk) // workers)
+                    for start in range(0, len(chunk), step):
+                        part = chunk.iloc[start:start + step]
+                        pending.append(executor.submit(_process_games_chunk, part))
+                        while len(pending) > workers:
+                            _write_chunk_result(games_buf, uri_maps, pending.popleft().result())
+
+            while pending:
+                _write_chunk_result(games_buf, uri_maps, pending.popleft().result())
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        # Abre el archivo de salida una sola vez con un buffer grande y escribe
+        # cada entidad con una sola llamada a write. Con compresión rápida
+        # (nivel 1) se escriben muchos menos bytes a disco
+        if compress:
+            out_file = gzip.open(output_file_path, 'wt', encoding='utf-8', compresslevel=1)
+        else:
+            out_file = open(output_file_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE)
+        with out_file as out:
+            # Comienza el archivo TTL
+            out.write("""@prefix : <http://www.semanticweb.org/kevin/ontologies/2025/7/VideoGames#> .
+@prefix dcterms: <http://purl.org/dc/terms/> .
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+@prefix schema: <http://schema.org/> .
+@prefix rawg: <http://rawg.io/ontology#> .
+@prefix vgo: <http://purl.org/net/VideoGameOntology#> .
+
+""")
+
+            # Genera las entidades auxiliares
+            print("Generando entidades auxiliares...")
+
+            # Plataformas
+            out.write("# Plataformas\n")
+            for platform, clean_platform in platform_uris.items():
                 if clean_platform:
-                    ttl_content += f' ;\n    schema:gamePlatform :platform_{clean_platform}'
+                    out.write(f':platform_{clean_platform} rdf:type schema:VideoGamePlatform ;\n'
+                              f'    schema:name "{clean_literal_string(platform)}" .\n\n')
 
-        # Desarrolladores
-        developers = parse_delimited_field(row.get('developers', ''))
-        for dev in developers:
-            if isinstance(dev, dict) and 'name' in dev:
-                clean_dev = clean_uri_string(dev['name'])
+            # Desarrolladores
+            out.write("# Desarrolladores\n")
+            for developer, clean_dev in developer_uris.items():
                 if clean_dev:
-                    ttl_content += f' ;\n    schema:developer :developer_{clean_dev}'
+                    out.write(f':developer_{clean_dev} rdf:type schema:Organization ;\n'
+                              f'    schema:name "{clean_literal_string(developer)}" .\n\n')
 
-        # Editores
-        publishers = parse_delimited_field(row.get('publishers', ''))
-        for pub in publishers:
-            if isinstance(pub, dict) and 'name' in pub:
-                clean_pub = clean_uri_string(pub['name'])
+            # Editores
+            out.write("# Editores\n")
+            for publisher, clean_pub in publisher_uris.items():
                 if clean_pub:
-                    ttl_content += f' ;\n    schema:publisher :publisher_{clean_pub}'
+                    out.write(f':publisher_{clean_pub} rdf:type schema:Organization ;\n'
+                              f'    schema:name "{clean_literal_string(publisher)}" .\n\n')
 
-        # Géneros
-        genres = parse_delimited_field(row.get('genres', ''))
-        for genre in genres:
-            if isinstance(genre, dict) and 'name' in genre:
-                clean_genre = clean_uri_string(genre['name'])
+            # Géneros
+            out.write("# Géneros\n")
+            for genre, clean_genre in genre_uris.items():
                 if clean_genre:
-                    ttl_content += f' ;\n    schema:genre :genre_{clean_genre}'
-
-        # Rating ESRB - Valor simple
-        esrb = row.get('esrb_rating', '')
-        if not pd.isna(esrb) and esrb != "":
-            clean_rating = clean_uri_string(str(esrb).strip())
-            if clean_rating:
-                ttl_content += f' ;\n    schema:contentRating :esrb_{clean_rating}'
+                    out.write(f':genre_{clean_genre} rdf:type schema:Genre ;\n'
+                              f'    schema:name "{clean_literal_string(genre)}" .\n\n')
 
-        ttl_content += " .\n\n"
+            # Ratings ESRB
+            out.write("# Ratings ESRB\n")
+            for rating, clean_rating in esrb_uris.items():
+                if clean_rating:
+                    out.write(f':esrb_{clean_rating} rdf:type schema:GameRating ;\n'
+                              f'    schema:name "{clean_literal_string(rating)}" .\n\n')
 
-    # Guarda el archivo
-    with open(output_file_path, 'w', encoding='utf-8') as f:
-        f.write(ttl_content)
+            # Videojuegos
+            out.write("# Videojuegos\n")
+            games_buf.seek(0)
+            shutil.copyfileobj(games_buf, out, OUTPUT_BUFFER_SIZE)
 
     print(f"Archivo TTL generado exitosamente: {output_file_path}")
-    print(f"Procesados {len(df)} juegos")
-    print(f"- {len(platforms_set)} plataformas únicas")
-    print(f"- {len(developers_set)} desarrolladores únicos")
-    print(f"- {len(publishers_set)} editores únicos")
-    print(f"- {len(genres_set)} géneros únicos")
-    print(f"- {len(esrb_ratings_set)} ratings ESRB únicos")
+    print(f"Procesados {total} juegos")
+    print(f"- {len(platform_uris)} plataformas únicas")
+    print(f"- {len(developer_uris)} desarrolladores únicos")
+    print(f"- {len(publisher_uris)} editores únicos")
+    print(f"- {len(genre_uris)} géneros únicos")
+    print(f"- {len(esrb_uris)} ratings ESRB únicos")
 
 
 def diagnose_csv_format(csv_file_path, num_samples=5):